@@ -3,6 +3,13 @@ from mpl_toolkits.mplot3d.art3d import Poly3DCollection
 import numpy as np
 import os
 import json
+import sqlite3
+import struct
+import sys
+import threading
+import time
+from collections import OrderedDict, deque
+from multiprocessing import resource_tracker, shared_memory
 
 
 """
@@ -45,8 +52,15 @@ class Cube:
     - edge_top_left (str): Edge at the top left of the cube.
 
     Methods:
-    - __init__(self): Initializes the cube with default corner and edge positions.
+    - __init__(self, history_limit): Initializes the cube with default corner and edge positions.
     - reset_state(self): Resets the cube to its default state.
+    - clone(self): Returns an independent copy of the cube including its move history.
+    - snapshot(self): Returns an immutable snapshot of the cube's corner and edge positions.
+    - restore(self, snapshot): Restores the cube's corner and edge positions from a snapshot and clears the move history.
+    - to_bytes(self): Encodes the cube's corner and edge positions as 20 bytes.
+    - from_bytes(cls, data): Creates a cube from the 20-byte encoding.
+    - undo(self, count): Reverts the last moves executed with move() by applying their inverse moves.
+    - redo(self, count): Re-executes moves that were reverted with undo.
     - set_state(self, corner_positions, edge_positions): Sets the cube's state based on given corner and edge positions.
     - save_cube_state(self, file_path): Saves the cube's state to a JSON file.
     - load_cube_state(self, file_path): Loads the cube's state from a JSON file.
@@ -62,9 +76,10 @@ class Cube:
     - move_l_counter_clockwise(self): Rotates the left layer of the cube counter-clockwise.
     - move_r_clockwise(self): Rotates the right layer of the cube clockwise.
     - move_r_counter_clockwise(self): Rotates the right layer of the cube counter-clockwise.
+      The move_* methods do not record the move history; use move() for moves that should be undoable.
     - get_cube_state(self): Returns the current state of the cube as a dictionary.
     - get_cycles(self): Finds and returns cycles in the cube's corner and edge positions.
-    - move(self, moves_to_execute): Executes a sequence of cube moves based on input.
+    - move(self, moves_to_execute): Executes a sequence of cube moves based on input and records them for undo.
     - choose_moves(self): Prompts the user to input cube moves and returns a filtered list of valid moves.
     - state(self): Prints the current position of corners and edges and their cycle representation.
     - draw_cube(ax, position): Draws a single cube at the specified position in a 3D plot.
@@ -72,9 +87,47 @@ class Cube:
 
     """
 
-    def __init__(self):
+    # Reihenfolge der Zustandsattribute, wie sie in snapshot() und restore() verwendet wird
+    STATE_ATTRIBUTES = (
+        "corner_front_bottom_left", "corner_front_bottom_right", "corner_back_bottom_right", "corner_back_bottom_left",
+        "corner_front_top_left", "corner_front_top_right", "corner_back_top_right", "corner_back_top_left",
+        "edge_front_bottom", "edge_bottom_right", "edge_back_bottom", "edge_bottom_left",
+        "edge_front_left", "edge_front_right", "edge_back_right", "edge_back_left",
+        "edge_front_top", "edge_top_right", "edge_back_top", "edge_top_left"
+    )
+
+    SOLVED_STATE = (1, 2, 3, 4, 5, 6, 7, 8, 'a', 'b', 'c', 'd', 'e', 'f', 'g', 'h', 'i', 'j', 'k', 'l')
+
+    MOVE_METHODS = {
+        'U': "move_u_clockwise",
+        'U\'': "move_u_counter_clockwise",
+        'D': "move_d_clockwise",
+        'D\'': "move_d_counter_clockwise",
+        'F': "move_f_clockwise",
+        'F\'': "move_f_counter_clockwise",
+        'B': "move_b_clockwise",
+        'B\'': "move_b_counter_clockwise",
+        'L': "move_l_clockwise",
+        'L\'': "move_l_counter_clockwise",
+        'R': "move_r_clockwise",
+        'R\'': "move_r_counter_clockwise"
+    }
+
+    INVERSE_MOVES = {
+        'U': 'U\'', 'U\'': 'U',
+        'D': 'D\'', 'D\'': 'D',
+        'F': 'F\'', 'F\'': 'F',
+        'B': 'B\'', 'B\'': 'B',
+        'L': 'L\'', 'L\'': 'L',
+        'R': 'R\'', 'R\'': 'R'
+    }
+
+    def __init__(self, history_limit=1000):
         """
         Initializes the cube with default corner and edge positions.
+
+        Parameters:
+        - history_limit (int): Maximum number of moves that can be undone.
         """
         self.corner_front_bottom_left = 1
         self.corner_front_bottom_right = 2
@@ -98,15 +151,153 @@ class Cube:
         self.edge_back_top = 'k'
         self.edge_top_left = 'l'
 
+        # Verlauf der ausgeführten Züge, gespeichert als inverse Züge
+        self._undo_history = deque(maxlen=history_limit)
+        self._redo_history = []
+
     def reset_state(self):
         """
-        Resets the cube to its default state.
+        Resets the cube to its default state and clears the move history.
+        """
+        self.restore(self.SOLVED_STATE)
+
+    def clone(self):
+        """
+        Creates an independent copy of the cube.
+
+        The corner and edge values are immutable and are shared with the copy, so only the
+        attribute dictionary and the move history are copied.
+
+        Returns:
+            Cube: A new cube with the same state and move history.
+        """
+        cube_copy = self.__class__.__new__(self.__class__)
+        cube_copy.__dict__.update(self.__dict__)
+        cube_copy._undo_history = self._undo_history.copy()
+        cube_copy._redo_history = self._redo_history.copy()
+        return cube_copy
+
+    def snapshot(self):
+        """
+        Returns an immutable snapshot of the cube's corner and edge positions.
+
+        Snapshots are plain tuples ordered like STATE_ATTRIBUTES. They can be shared freely between
+        cubes and restored any number of times.
+
+        Returns:
+            tuple: The current corner and edge positions.
+        """
+        return tuple(map(self.__dict__.__getitem__, self.STATE_ATTRIBUTES))
+
+    def restore(self, snapshot):
+        """
+        Restores the cube's corner and edge positions from a snapshot and clears the move history.
+
+        Parameters:
+        - snapshot (tuple): A snapshot created by snapshot().
+
+        Raises:
+        - ValueError: If the snapshot does not contain 20 elements.
+        """
+        if len(snapshot) != len(self.STATE_ATTRIBUTES):
+            raise ValueError("The snapshot must contain 20 elements.")
+
+        self.__dict__.update(zip(self.STATE_ATTRIBUTES, snapshot))
+
+        # Der bisherige Verlauf passt nicht mehr zum wiederhergestellten Zustand
+        self._undo_history.clear()
+        self._redo_history.clear()
+
+    def to_bytes(self):
+        """
+        Encodes the cube's corner and edge positions as 20 bytes.
+
+        The first 8 bytes hold the corner numbers, the last 12 bytes the ASCII codes of the edge letters,
+        both ordered like STATE_ATTRIBUTES.
+
+        Returns:
+            bytes: The encoded cube state.
+
+        Raises:
+        - ValueError: If a corner is not an integer from 0 to 255 or an edge is not a single ASCII character.
+        """
+        state = self.snapshot()
+
+        if not all(isinstance(corner, int) and 0 <= corner <= 255 for corner in state[:8]):
+            raise ValueError("Each corner must be an integer from 0 to 255.")
+        if not all(isinstance(edge, str) and len(edge) == 1 and edge.isascii() for edge in state[8:]):
+            raise ValueError("Each edge must be a single ASCII character.")
+
+        return bytes(state[:8]) + "".join(state[8:]).encode("ascii")
+
+    @classmethod
+    def from_bytes(cls, data):
+        """
+        Creates a cube from the 20-byte encoding returned by to_bytes().
+
+        Parameters:
+        - data (bytes): The encoded cube state.
+
+        Returns:
+            Cube: A new cube with the decoded state and an empty move history.
+
+        Raises:
+        - ValueError: If data does not contain 20 bytes.
+        """
+        data = bytes(data)
+        if len(data) != len(cls.STATE_ATTRIBUTES):
+            raise ValueError("The encoded cube state must contain 20 bytes.")
+
+        cube = cls()
+        cube.restore(tuple(data[:8]) + tuple(data[8:].decode("ascii")))
+        return cube
+
+    def undo(self, count=1):
+        """
+        Reverts the last executed moves by applying their inverse moves.
+
+        Only moves executed with move() are recorded. Calling a move_* method directly changes the
+        state without recording it, so undo() would no longer return to earlier states.
+
+        Args:
+            count (int): Number of moves to revert.
+
+        Returns:
+            int: Number of moves that were actually reverted.
+        """
+        undone = 0
+        while undone < count and self._undo_history:
+            # Eintrag erst nach erfolgreicher Ausführung entfernen
+            inverse_move = self._undo_history[-1]
+            getattr(self, self.MOVE_METHODS[inverse_move])()
+            self._undo_history.pop()
+            self._redo_history.append(self.INVERSE_MOVES[inverse_move])
+            undone += 1
+        return undone
+
+    def redo(self, count=1):
+        """
+        Re-executes moves that were reverted with undo.
+
+        Args:
+            count (int): Number of moves to re-execute.
+
+        Returns:
+            int: Number of moves that were actually re-executed.
         """
-        self.__init__()
+        redone = 0
+        while redone < count and self._redo_history:
+            # Eintrag erst nach erfolgreicher Ausführung entfernen
+            move = self._redo_history[-1]
+            getattr(self, self.MOVE_METHODS[move])()
+            self._redo_history.pop()
+            self._undo_history.append(self.INVERSE_MOVES[move])
+            redone += 1
+        return redone
 
     def set_state(self, corner_positions, edge_positions):
         """
-        Sets the cube's state based on given corner and edge positions.
+        Sets the cube's state based on given corner and edge positions and clears the move history.
 
         Parameters:
         - corner_positions (dict): Dictionary containing corner positions.
@@ -143,6 +334,10 @@ class Cube:
         self.edge_back_top = edge_positions["edge_back_top"]
         self.edge_top_left = edge_positions["edge_top_left"]
 
+        # Der bisherige Verlauf passt nicht mehr zum neuen Zustand
+        self._undo_history.clear()
+        self._redo_history.clear()
+
     def save_state(self, file_path="Cube_State.json"):
         """
         Saves the cube's state to a JSON file.
@@ -201,12 +396,12 @@ class Cube:
         Updates the positions of corners and edges accordingly.
         """
         # Drehung der Ecken entsprechend einer U-Drehung
-        self.corner_front_top_left, self.corner_front_top_right, self.corner_back_top_left, self.corner_back_top_right = \
-            self.corner_back_top_right, self.corner_front_top_left, self.corner_front_top_right, self.corner_back_top_left
+        self.corner_back_top_left, self.corner_back_top_right, self.corner_front_top_right, self.corner_front_top_left = \
+            self.corner_front_top_left, self.corner_back_top_left, self.corner_back_top_right, self.corner_front_top_right
 
         # Drehung der Kanten entsprechend einer U-Drehung
-        self.edge_front_top, self.edge_back_top, self.edge_top_left, self.edge_top_right = \
-            self.edge_top_right, self.edge_front_top, self.edge_back_top, self.edge_top_left
+        self.edge_top_left, self.edge_back_top, self.edge_top_right, self.edge_front_top = \
+            self.edge_front_top, self.edge_top_left, self.edge_back_top, self.edge_top_right
 
     def move_u_counter_clockwise(self):
         """
@@ -215,12 +410,12 @@ class Cube:
         Updates the positions of corners and edges accordingly.
         """
         # Drehung der Ecken entsprechend einer U'-Drehung
-        self.corner_front_top_left, self.corner_front_top_right, self.corner_back_top_left, self.corner_back_top_right = \
-            self.corner_back_top_left, self.corner_front_top_right, self.corner_front_top_left, self.corner_back_top_right
+        self.corner_back_top_right, self.corner_back_top_left, self.corner_front_top_left, self.corner_front_top_right = \
+            self.corner_front_top_right, self.corner_back_top_right, self.corner_back_top_left, self.corner_front_top_left
 
         # Drehung der Kanten entsprechend einer U'-Drehung
-        self.edge_front_top, self.edge_back_top, self.edge_top_left, self.edge_top_right = \
-            self.edge_top_left, self.edge_front_top, self.edge_back_top, self.edge_top_right
+        self.edge_back_top, self.edge_top_left, self.edge_front_top, self.edge_top_right = \
+            self.edge_top_right, self.edge_back_top, self.edge_top_left, self.edge_front_top
 
     def move_d_clockwise(self):
         """
@@ -229,12 +424,12 @@ class Cube:
         Updates the positions of corners and edges accordingly.
         """
         # Drehung der Ecken entsprechend einer D-Drehung
-        self.corner_front_bottom_left, self.corner_front_bottom_right, self.corner_back_bottom_left, self.corner_back_bottom_right = \
-            self.corner_back_bottom_right, self.corner_front_bottom_left, self.corner_front_bottom_right, self.corner_back_bottom_left
+        self.corner_front_bottom_right, self.corner_back_bottom_right, self.corner_back_bottom_left, self.corner_front_bottom_left = \
+            self.corner_front_bottom_left, self.corner_front_bottom_right, self.corner_back_bottom_right, self.corner_back_bottom_left
 
         # Drehung der Kanten entsprechend einer D-Drehung
-        self.edge_front_bottom, self.edge_back_bottom, self.edge_bottom_left, self.edge_bottom_right = \
-            self.edge_bottom_right, self.edge_front_bottom, self.edge_back_bottom, self.edge_bottom_left
+        self.edge_bottom_right, self.edge_back_bottom, self.edge_bottom_left, self.edge_front_bottom = \
+            self.edge_front_bottom, self.edge_bottom_right, self.edge_back_bottom, self.edge_bottom_left
 
     def move_d_counter_clockwise(self):
         """
@@ -243,12 +438,12 @@ class Cube:
         Updates the positions of corners and edges accordingly.
         """
         # Drehung der Ecken entsprechend einer D'-Drehung
-        self.corner_front_bottom_left, self.corner_front_bottom_right, self.corner_back_bottom_left, self.corner_back_bottom_right = \
-            self.corner_back_bottom_right, self.corner_front_bottom_left, self.corner_front_bottom_right, self.corner_back_bottom_left
+        self.corner_back_bottom_right, self.corner_front_bottom_right, self.corner_front_bottom_left, self.corner_back_bottom_left = \
+            self.corner_back_bottom_left, self.corner_back_bottom_right, self.corner_front_bottom_right, self.corner_front_bottom_left
 
         # Drehung der Kanten entsprechend einer D'-Drehung
-        self.edge_front_bottom, self.edge_back_bottom, self.edge_bottom_left, self.edge_bottom_right = \
-            self.edge_bottom_right, self.edge_front_bottom, self.edge_back_bottom, self.edge_bottom_left
+        self.edge_back_bottom, self.edge_bottom_right, self.edge_front_bottom, self.edge_bottom_left = \
+            self.edge_bottom_left, self.edge_back_bottom, self.edge_bottom_right, self.edge_front_bottom
 
     def move_f_clockwise(self):
         """
@@ -256,11 +451,13 @@ class Cube:
 
         Updates the positions of corners and edges accordingly.
         """
-        self.corner_front_bottom_left, self.corner_front_bottom_right, self.corner_front_top_left, self.corner_front_top_right = \
-            self.corner_front_top_left, self.corner_front_bottom_left, self.corner_front_top_right, self.corner_front_bottom_right
+        # Drehung der Ecken entsprechend einer F-Drehung
+        self.corner_front_top_right, self.corner_front_bottom_right, self.corner_front_bottom_left, self.corner_front_top_left = \
+            self.corner_front_top_left, self.corner_front_top_right, self.corner_front_bottom_right, self.corner_front_bottom_left
 
-        self.edge_front_bottom, self.edge_front_left, self.edge_front_right, self.edge_front_top = \
-            self.edge_front_top, self.edge_front_bottom, self.edge_front_top, self.edge_front_right
+        # Drehung der Kanten entsprechend einer F-Drehung
+        self.edge_front_top, self.edge_front_right, self.edge_front_bottom, self.edge_front_left = \
+            self.edge_front_left, self.edge_front_top, self.edge_front_right, self.edge_front_bottom
 
     def move_f_counter_clockwise(self):
         """
@@ -269,12 +466,12 @@ class Cube:
         Updates the positions of corners and edges accordingly.
         """
         # Drehung der Ecken entsprechend einer F'-Drehung
-        self.corner_front_bottom_left, self.corner_front_bottom_right, self.corner_front_top_left, self.corner_front_top_right = \
-            self.corner_front_top_right, self.corner_front_bottom_left, self.corner_front_bottom_right, self.corner_front_top_left
+        self.corner_front_bottom_right, self.corner_front_top_right, self.corner_front_top_left, self.corner_front_bottom_left = \
+            self.corner_front_bottom_left, self.corner_front_bottom_right, self.corner_front_top_right, self.corner_front_top_left
 
         # Drehung der Kanten entsprechend einer F'-Drehung
-        self.edge_front_bottom, self.edge_front_left, self.edge_front_right, self.edge_front_top = \
-            self.edge_front_top, self.edge_front_bottom, self.edge_front_top, self.edge_front_right
+        self.edge_front_right, self.edge_front_top, self.edge_front_left, self.edge_front_bottom = \
+            self.edge_front_bottom, self.edge_front_right, self.edge_front_top, self.edge_front_left
 
     def move_b_clockwise(self):
         """
@@ -282,11 +479,13 @@ class Cube:
 
         Updates the positions of corners and edges accordingly.
         """
-        self.corner_back_bottom_left, self.corner_back_top_left, self.corner_back_top_right, self.corner_back_bottom_right = \
-            self.corner_back_top_right, self.corner_back_bottom_left, self.corner_back_bottom_right, self.corner_back_top_left
+        # Drehung der Ecken entsprechend einer B-Drehung
+        self.corner_back_top_left, self.corner_back_bottom_left, self.corner_back_bottom_right, self.corner_back_top_right = \
+            self.corner_back_top_right, self.corner_back_top_left, self.corner_back_bottom_left, self.corner_back_bottom_right
 
-        self.edge_back_bottom, self.edge_back_left, self.edge_back_right, self.edge_back_top = \
-            self.edge_back_top, self.edge_back_bottom, self.edge_back_top, self.edge_back_right
+        # Drehung der Kanten entsprechend einer B-Drehung
+        self.edge_back_top, self.edge_back_left, self.edge_back_bottom, self.edge_back_right = \
+            self.edge_back_right, self.edge_back_top, self.edge_back_left, self.edge_back_bottom
 
     def move_b_counter_clockwise(self):
         """
@@ -295,12 +494,12 @@ class Cube:
         Updates the positions of corners and edges accordingly.
         """
         # Drehung der Ecken entsprechend einer B'-Drehung
-        self.corner_back_bottom_left, self.corner_back_bottom_right, self.corner_back_top_left, self.corner_back_top_right = \
-            self.corner_back_top_right, self.corner_back_bottom_left, self.corner_back_bottom_right, self.corner_back_top_left
+        self.corner_back_bottom_left, self.corner_back_top_left, self.corner_back_top_right, self.corner_back_bottom_right = \
+            self.corner_back_bottom_right, self.corner_back_bottom_left, self.corner_back_top_left, self.corner_back_top_right
 
         # Drehung der Kanten entsprechend einer B'-Drehung
-        self.edge_back_bottom, self.edge_back_left, self.edge_back_right, self.edge_back_top = \
-            self.edge_back_top, self.edge_back_bottom, self.edge_back_top, self.edge_back_right
+        self.edge_back_left, self.edge_back_top, self.edge_back_right, self.edge_back_bottom = \
+            self.edge_back_bottom, self.edge_back_left, self.edge_back_top, self.edge_back_right
 
     def move_l_clockwise(self):
         """
@@ -308,11 +507,13 @@ class Cube:
 
         Updates the positions of corners and edges accordingly.
         """
-        self.corner_front_bottom_left, self.corner_back_bottom_left, self.corner_back_top_left, self.corner_front_top_left = \
-            self.corner_back_bottom_left, self.corner_back_top_left, self.corner_front_top_left, self.corner_front_bottom_left
+        # Drehung der Ecken entsprechend einer L-Drehung
+        self.corner_back_bottom_left, self.corner_back_top_left, self.corner_front_top_left, self.corner_front_bottom_left = \
+            self.corner_front_bottom_left, self.corner_back_bottom_left, self.corner_back_top_left, self.corner_front_top_left
 
-        self.edge_bottom_left, self.edge_back_left, self.edge_top_left, self.edge_front_left = \
-            self.edge_back_left, self.edge_top_left, self.edge_front_left, self.edge_bottom_left
+        # Drehung der Kanten entsprechend einer L-Drehung
+        self.edge_back_left, self.edge_top_left, self.edge_front_left, self.edge_bottom_left = \
+            self.edge_bottom_left, self.edge_back_left, self.edge_top_left, self.edge_front_left
 
     def move_l_counter_clockwise(self):
         """
@@ -321,8 +522,12 @@ class Cube:
         Updates the positions of corners and edges accordingly.
         """
         # Drehung der Ecken entsprechend einer L'-Drehung
-        self.corner_front_bottom_left, self.corner_back_bottom_left, self.corner_back_top_left, self.corner_front_top_left = \
-            self.corner_front_top_left, self.corner_front_bottom_left, self.corner_back_bottom
+        self.corner_back_top_left, self.corner_back_bottom_left, self.corner_front_bottom_left, self.corner_front_top_left = \
+            self.corner_front_top_left, self.corner_back_top_left, self.corner_back_bottom_left, self.corner_front_bottom_left
+
+        # Drehung der Kanten entsprechend einer L'-Drehung
+        self.edge_top_left, self.edge_back_left, self.edge_bottom_left, self.edge_front_left = \
+            self.edge_front_left, self.edge_top_left, self.edge_back_left, self.edge_bottom_left
 
     def move_r_clockwise(self):
         """
@@ -330,9 +535,11 @@ class Cube:
 
         Updates the positions of corners and edges accordingly.
         """
-        self.corner_front_bottom_right, self.corner_front_top_right, self.corner_back_top_right, self.corner_back_bottom_right = \
-            self.corner_back_top_right, self.corner_front_bottom_right, self.corner_front_top_right, self.corner_back_bottom_right
+        # Drehung der Ecken entsprechend einer R-Drehung
+        self.corner_front_top_right, self.corner_back_top_right, self.corner_back_bottom_right, self.corner_front_bottom_right = \
+            self.corner_front_bottom_right, self.corner_front_top_right, self.corner_back_top_right, self.corner_back_bottom_right
 
+        # Drehung der Kanten entsprechend einer R-Drehung
         self.edge_front_right, self.edge_top_right, self.edge_back_right, self.edge_bottom_right = \
             self.edge_bottom_right, self.edge_front_right, self.edge_top_right, self.edge_back_right
 
@@ -343,16 +550,16 @@ class Cube:
         Updates the positions of corners and edges accordingly.
         """
         # Drehung der Ecken entsprechend einer R'-Drehung
-        self.corner_front_bottom_right, self.corner_back_bottom_right, self.corner_back_top_right, self.corner_front_top_right = \
-            self.corner_front_top_right, self.corner_front_bottom_right, self.corner_back_bottom_right, self.corner_back_top_right
+        self.corner_back_top_right, self.corner_front_top_right, self.corner_front_bottom_right, self.corner_back_bottom_right = \
+            self.corner_back_bottom_right, self.corner_back_top_right, self.corner_front_top_right, self.corner_front_bottom_right
 
         # Drehung der Kanten entsprechend einer R'-Drehung
-        self.edge_front_right, self.edge_back_right, self.edge_bottom_right, self.edge_top_right = \
-            self.edge_top_right, self.edge_front_right, self.edge_back_right, self.edge_bottom_right
+        self.edge_top_right, self.edge_front_right, self.edge_bottom_right, self.edge_back_right = \
+            self.edge_back_right, self.edge_top_right, self.edge_front_right, self.edge_bottom_right
 
     def move(self, moves_to_execute):
         """
-        Executes a sequence of cube moves.
+        Executes a sequence of cube moves and records them in the move history for undo().
 
         Args:
             moves_to_execute (list): List of cube moves to be executed.
@@ -360,31 +567,20 @@ class Cube:
         Raises:
             ValueError: If an invalid move is encountered.
         """
-        move_mapping = {
-            'U': self.move_u_clockwise,
-            'U\'': self.move_u_counter_clockwise,
-            'D': self.move_d_clockwise,
-            'D\'': self.move_d_counter_clockwise,
-            'F': self.move_f_clockwise,
-            'F\'': self.move_f_counter_clockwise,
-            'B': self.move_b_clockwise,
-            'B\'': self.move_b_counter_clockwise,
-            'L': self.move_l_clockwise,
-            'L\'': self.move_l_counter_clockwise,
-            'R': self.move_r_clockwise,
-            'R\'': self.move_r_counter_clockwise
-        }
-
         for move in moves_to_execute:
             if move == " ":
                 continue
             try:
-                move_function = move_mapping[move]
+                move_function = getattr(self, self.MOVE_METHODS[move])
                 move_function()
             except KeyError:
                 print(f"Ungültiger Zug: {move}")
             except Exception as e:
                 print(f"Fehler beim Ausführen des Zuges {move}: {e}")
+            else:
+                # Nur erfolgreich ausgeführte Züge können rückgängig gemacht werden
+                self._undo_history.append(self.INVERSE_MOVES[move])
+                self._redo_history.clear()
 
     @staticmethod
     def choose_moves():
@@ -638,6 +834,530 @@ class Cube:
                 print(f"{name}: {description}")
 
 
+class SharedCubeStore:
+    """
+    Stores the states of many named cubes in shared memory for one writer and several reader processes.
+
+    The shared memory block starts with a header (signature, capacity, number of used slots) followed by
+    fixed-size slots. Each slot holds a sequence counter, the cube name and the 20-byte state from
+    Cube.to_bytes(). The writer makes the counter odd while it updates a slot and even again afterwards,
+    so readers can detect and retry torn reads without any locking.
+
+    Only one process may write (put). Any number of processes may read (get, get_bytes, view, version).
+
+    Methods:
+    - __init__(self, name, capacity, create): Creates or attaches to a shared cube store.
+    - put(self, cube_name, cube): Writes the state of a cube into the store.
+    - get(self, cube_name, timeout): Returns a consistent copy of a stored cube as a Cube.
+    - get_bytes(self, cube_name, timeout): Returns a consistent copy of a stored cube state as 20 bytes.
+    - view(self, cube_name): Returns a zero-copy NumPy view of a stored cube state.
+    - version(self, cube_name): Returns the sequence counter of a stored cube.
+    - names(self): Returns the names of all stored cubes.
+    - close(self): Detaches from the shared memory block.
+    - unlink(self): Removes the shared memory block.
+    """
+
+    SIGNATURE = b"CUBE"
+    HEADER_FORMAT = "<4sII"
+    SLOT_FORMAT = "<I32s20s"
+    NAME_SIZE = 32
+    STATE_SIZE = 20
+
+    HEADER_SIZE = struct.calcsize(HEADER_FORMAT)
+    SLOT_SIZE = 64
+    USED_SLOTS_OFFSET = 8
+    NAME_OFFSET = 4
+    STATE_OFFSET = 36
+
+    _attach_lock = threading.Lock()
+
+    def __init__(self, name=None, capacity=64, create=False):
+        """
+        Creates a new shared cube store or attaches to an existing one.
+
+        Parameters:
+        - name (str): Name of the shared memory block. Required when attaching.
+        - capacity (int): Maximum number of cubes. Only used when creating the store.
+        - create (bool): If True, a new shared memory block is created.
+
+        Raises:
+        - ValueError: If the shared memory block is not a cube store.
+        """
+        if create:
+            size = self.HEADER_SIZE + capacity * self.SLOT_SIZE
+            self.shared_memory = shared_memory.SharedMemory(name=name, create=True, size=size)
+            struct.pack_into(self.HEADER_FORMAT, self.shared_memory.buf, 0, self.SIGNATURE, capacity, 0)
+        else:
+            self.shared_memory = self._attach(name)
+
+        signature, self.capacity, _ = struct.unpack_from(self.HEADER_FORMAT, self.shared_memory.buf, 0)
+        if signature != self.SIGNATURE:
+            self.shared_memory.close()
+            raise ValueError("The shared memory block does not contain a cube store.")
+
+        self.name = self.shared_memory.name
+        self._slots = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    @staticmethod
+    def _attach(name):
+        """
+        Attaches to an existing shared memory block without registering it with the resource tracker.
+
+        A registered block is removed by the resource tracker when the attaching process exits. Before
+        Python 3.13 SharedMemory always registers the block, and forked processes share the tracker of
+        their parent, so unregistering afterwards would also drop the writer's registration. The
+        registration is therefore skipped while attaching.
+        """
+        if sys.version_info >= (3, 13):
+            return shared_memory.SharedMemory(name=name, track=False)
+
+        with SharedCubeStore._attach_lock:
+            register = resource_tracker.register
+            resource_tracker.register = lambda name, rtype: None
+            try:
+                return shared_memory.SharedMemory(name=name)
+            finally:
+                resource_tracker.register = register
+
+    def _used_slots(self):
+        return struct.unpack_from("<I", self.shared_memory.buf, self.USED_SLOTS_OFFSET)[0]
+
+    def _refresh_slots(self):
+        """
+        Reads the names of slots added by the writer since the last refresh.
+        """
+        buffer = self.shared_memory.buf
+        for index in range(len(self._slots), self._used_slots()):
+            slot_offset = self.HEADER_SIZE + index * self.SLOT_SIZE
+            raw_name = bytes(buffer[slot_offset + self.NAME_OFFSET:slot_offset + self.STATE_OFFSET])
+            self._slots[raw_name.rstrip(b"\0").decode("utf-8")] = slot_offset
+
+    def _slot_offset(self, cube_name):
+        """
+        Returns the offset of the slot of a cube, or None if the cube is not stored.
+        """
+        if cube_name not in self._slots:
+            self._refresh_slots()
+        return self._slots.get(cube_name)
+
+    def _require_slot(self, cube_name):
+        offset = self._slot_offset(cube_name)
+        if offset is None:
+            raise KeyError(f"Cube '{cube_name}' is not stored.")
+        return offset
+
+    def put(self, cube_name, cube):
+        """
+        Writes the state of a cube into the store, adding the cube name if necessary.
+
+        Must only be called from the single writer process.
+
+        Parameters:
+        - cube_name (str): Name of the cube, at most 32 bytes in UTF-8.
+        - cube (Cube): The cube whose state is stored.
+
+        Raises:
+        - ValueError: If the name is too long, the store is full or the cube state cannot be encoded in 20 bytes.
+        """
+        buffer = self.shared_memory.buf
+        state = cube.to_bytes()
+        if len(state) != self.STATE_SIZE:
+            raise ValueError("The encoded cube state must contain 20 bytes.")
+
+        offset = self._slot_offset(cube_name)
+
+        if offset is None:
+            raw_name = cube_name.encode("utf-8")
+            if not raw_name or len(raw_name) > self.NAME_SIZE:
+                raise ValueError("The cube name must contain 1 to 32 bytes.")
+
+            used_slots = self._used_slots()
+            if used_slots >= self.capacity:
+                raise ValueError("The cube store is full.")
+
+            # Slot vollständig beschreiben, bevor er über die Anzahl der Slots sichtbar wird
+            offset = self.HEADER_SIZE + used_slots * self.SLOT_SIZE
+            struct.pack_into(self.SLOT_FORMAT, buffer, offset, 0, raw_name, state)
+            struct.pack_into("<I", buffer, self.USED_SLOTS_OFFSET, used_slots + 1)
+            self._slots[cube_name] = offset
+            return
+
+        sequence = struct.unpack_from("<I", buffer, offset)[0]
+        struct.pack_into("<I", buffer, offset, (sequence + 1) & 0xFFFFFFFF)
+        try:
+            buffer[offset + self.STATE_OFFSET:offset + self.STATE_OFFSET + self.STATE_SIZE] = state
+        finally:
+            # Zähler muss wieder gerade werden, sonst warten Leser bis zum Timeout
+            struct.pack_into("<I", buffer, offset, (sequence + 2) & 0xFFFFFFFF)
+
+    def get_bytes(self, cube_name, timeout=1.0):
+        """
+        Returns a consistent copy of a stored cube state.
+
+        Retries while the writer is updating the cube.
+
+        Parameters:
+        - cube_name (str): Name of the cube.
+        - timeout (float): Maximum time in seconds to wait for a consistent read.
+
+        Returns:
+            bytes: The 20-byte cube state as produced by Cube.to_bytes().
+
+        Raises:
+        - KeyError: If the cube is not stored.
+        - TimeoutError: If no consistent state could be read within timeout, e.g. because the writer
+          stopped in the middle of an update.
+        """
+        buffer = self.shared_memory.buf
+        offset = self._require_slot(cube_name)
+        state_offset = offset + self.STATE_OFFSET
+        deadline = time.monotonic() + timeout
+
+        while True:
+            sequence = struct.unpack_from("<I", buffer, offset)[0]
+            if not sequence % 2:
+                state = bytes(buffer[state_offset:state_offset + self.STATE_SIZE])
+                if struct.unpack_from("<I", buffer, offset)[0] == sequence:
+                    return state
+
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"Cube '{cube_name}' could not be read consistently.")
+            # Dem Schreibprozess Rechenzeit überlassen
+            time.sleep(0)
+
+    def get(self, cube_name, timeout=1.0):
+        """
+        Returns a consistent copy of a stored cube.
+
+        Parameters:
+        - cube_name (str): Name of the cube.
+        - timeout (float): Maximum time in seconds to wait for a consistent read.
+
+        Returns:
+            Cube: A new cube with the stored state.
+
+        Raises:
+        - KeyError: If the cube is not stored.
+        - TimeoutError: If no consistent state could be read within timeout.
+        """
+        return Cube.from_bytes(self.get_bytes(cube_name, timeout))
+
+    def view(self, cube_name):
+        """
+        Returns a zero-copy NumPy view of a stored cube state.
+
+        The view follows later writes. Compare version() before and after reading it to detect
+        concurrent updates, or use get_bytes() for a consistent copy.
+
+        Parameters:
+        - cube_name (str): Name of the cube.
+
+        Returns:
+            numpy.ndarray: Array of 20 uint8 values laid out like Cube.to_bytes().
+
+        Raises:
+        - KeyError: If the cube is not stored.
+        """
+        offset = self._require_slot(cube_name) + self.STATE_OFFSET
+        return np.frombuffer(self.shared_memory.buf, dtype=np.uint8, count=self.STATE_SIZE, offset=offset)
+
+    def version(self, cube_name):
+        """
+        Returns the sequence counter of a stored cube.
+
+        The counter is odd while the writer updates the cube and increases by 2 with each update.
+
+        Parameters:
+        - cube_name (str): Name of the cube.
+
+        Returns:
+            int: The current sequence counter.
+
+        Raises:
+        - KeyError: If the cube is not stored.
+        """
+        return struct.unpack_from("<I", self.shared_memory.buf, self._require_slot(cube_name))[0]
+
+    def names(self):
+        """
+        Returns the names of all stored cubes.
+
+        Returns:
+            list: Names in the order in which they were added.
+        """
+        self._refresh_slots()
+        return list(self._slots)
+
+    def close(self):
+        """
+        Detaches from the shared memory block. Views returned by view() must be released first.
+        """
+        self.shared_memory.close()
+
+    def unlink(self):
+        """
+        Removes the shared memory block. Should be called once by the writer when the store is no longer needed.
+        """
+        self.shared_memory.unlink()
+
+
+class SolveResultCache:
+    """
+    Caches solve results keyed by the 20-byte cube encoding from Cube.to_bytes().
+
+    Lookups go through an in-memory LRU tier first and fall back to an SQLite database on disk, which
+    can be shared by several worker processes. Keys may be passed as bytes (for example from
+    SharedCubeStore.get_bytes()), so cached results can be returned without constructing a Cube.
+    Results must be JSON-serializable; both tiers keep the JSON text and every lookup returns a newly
+    decoded object.
+
+    The memory tier of one process may serve a result for up to memory_max_age seconds after another
+    process has replaced, evicted or cleared it. Access times of memory hits are written to disk in
+    batches, so results that are hot in one process are not evicted by the others.
+
+    Methods:
+    - __init__(self, file_path, memory_size, max_entries, max_age, memory_max_age): Opens or creates the cache.
+    - key(state): Returns the canonical cache key of a cube or encoded cube state.
+    - get(self, state, default): Returns a cached result or default.
+    - put(self, state, result): Stores a result in both tiers.
+    - get_or_compute(self, state, compute): Returns a cached result or computes and stores it.
+    - evict(self): Removes expired entries and entries beyond max_entries from the disk tier.
+    - clear(self): Removes all entries from both tiers.
+    - stats(self): Returns hit and miss counters and the hit rate.
+    - close(self): Closes the database connection.
+    """
+
+    EVICT_INTERVAL = 100
+    ACCESS_FLUSH_INTERVAL = 100
+
+    def __init__(self, file_path="Solve_Cache.sqlite", memory_size=1024, max_entries=100000, max_age=None,
+                 memory_max_age=60):
+        """
+        Opens or creates a solve result cache.
+
+        Parameters:
+        - file_path (str): Path of the SQLite database file.
+        - memory_size (int): Maximum number of results kept in memory.
+        - max_entries (int): Maximum number of results kept on disk.
+        - max_age (float): Optional. Maximum age of a result in seconds.
+        - memory_max_age (float): Seconds after which a result in memory is checked against the disk tier again.
+        """
+        self.file_path = file_path
+        self.memory_size = memory_size
+        self.max_entries = max_entries
+        self.max_age = max_age
+        self.memory_max_age = memory_max_age
+
+        self._memory = OrderedDict()
+        self._accessed = {}
+        self._puts = 0
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+        # WAL erlaubt gleichzeitiges Lesen mehrerer Prozesse während eines Schreibvorgangs
+        self._connection = sqlite3.connect(file_path, timeout=30, isolation_level=None)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS results ("
+            "key BLOB PRIMARY KEY, result TEXT NOT NULL, created REAL NOT NULL, accessed REAL NOT NULL)"
+        )
+        self._connection.execute("CREATE INDEX IF NOT EXISTS results_accessed ON results (accessed)")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    @staticmethod
+    def key(state):
+        """
+        Returns the canonical cache key of a cube or encoded cube state.
+
+        Parameters:
+        - state (Cube or bytes): A cube or its encoding from Cube.to_bytes().
+
+        Returns:
+            bytes: The 20-byte cache key.
+
+        Raises:
+        - ValueError: If an encoded state does not contain 20 bytes.
+        """
+        if isinstance(state, Cube):
+            return state.to_bytes()
+
+        key = bytes(state)
+        if len(key) != len(Cube.STATE_ATTRIBUTES):
+            raise ValueError("The encoded cube state must contain 20 bytes.")
+        return key
+
+    def _is_expired(self, created, now):
+        return self.max_age is not None and now - created > self.max_age
+
+    def _remember(self, key, result_text, created, now):
+        self._memory[key] = (result_text, created, now)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_size:
+            self._memory.popitem(last=False)
+
+    def get(self, state, default=None):
+        """
+        Returns the cached result for a cube state.
+
+        Parameters:
+        - state (Cube or bytes): A cube or its encoding from Cube.to_bytes().
+        - default: Value returned if no valid result is cached.
+
+        Returns:
+            The cached result or default.
+        """
+        key = self.key(state)
+        now = time.time()
+
+        entry = self._memory.get(key)
+        if entry is not None:
+            result_text, created, loaded = entry
+            if not self._is_expired(created, now) and now - loaded <= self.memory_max_age:
+                self._memory.move_to_end(key)
+                self.memory_hits += 1
+
+                # Zugriffszeit gesammelt auf die Festplatte schreiben
+                self._accessed[key] = now
+                if len(self._accessed) >= self.ACCESS_FLUSH_INTERVAL:
+                    self._flush_accessed()
+                return json.loads(result_text)
+            del self._memory[key]
+
+        row = self._connection.execute("SELECT result, created FROM results WHERE key = ?", (key,)).fetchone()
+        if row is None or self._is_expired(row[1], now):
+            self.misses += 1
+            return default
+
+        self._connection.execute("UPDATE results SET accessed = ? WHERE key = ?", (now, key))
+        self._accessed.pop(key, None)
+        self._remember(key, row[0], row[1], now)
+        self.disk_hits += 1
+        return json.loads(row[0])
+
+    def put(self, state, result):
+        """
+        Stores the result for a cube state in memory and on disk.
+
+        Parameters:
+        - state (Cube or bytes): A cube or its encoding from Cube.to_bytes().
+        - result: JSON-serializable solve result.
+        """
+        key = self.key(state)
+        now = time.time()
+        result_text = json.dumps(result)
+
+        self._connection.execute(
+            "INSERT OR REPLACE INTO results (key, result, created, accessed) VALUES (?, ?, ?, ?)",
+            (key, result_text, now, now)
+        )
+        self._accessed.pop(key, None)
+        self._remember(key, result_text, now, now)
+
+        self._puts += 1
+        if self._puts % self.EVICT_INTERVAL == 0:
+            self.evict()
+
+    def get_or_compute(self, state, compute):
+        """
+        Returns the cached result for a cube state, computing and storing it on a miss.
+
+        Parameters:
+        - state (Cube or bytes): A cube or its encoding from Cube.to_bytes().
+        - compute (callable): Called with state on a miss; its return value is cached.
+
+        Returns:
+            The cached or computed result.
+        """
+        missing = object()
+        result = self.get(state, missing)
+        if result is missing:
+            result = compute(state)
+            self.put(state, result)
+        return result
+
+    def evict(self):
+        """
+        Removes expired results and the least recently used results beyond max_entries from the disk tier.
+
+        Returns:
+            int: Number of removed results.
+        """
+        self._flush_accessed()
+
+        removed = 0
+        if self.max_age is not None:
+            removed += self._connection.execute(
+                "DELETE FROM results WHERE created < ?", (time.time() - self.max_age,)
+            ).rowcount
+        removed += self._connection.execute(
+            "DELETE FROM results WHERE key IN (SELECT key FROM results ORDER BY accessed DESC LIMIT -1 OFFSET ?)",
+            (self.max_entries,)
+        ).rowcount
+        return removed
+
+    def _flush_accessed(self):
+        """
+        Writes the access times collected from memory hits to the disk tier.
+        """
+        if self._accessed:
+            self._connection.execute("BEGIN")
+            try:
+                self._connection.executemany(
+                    "UPDATE results SET accessed = max(accessed, ?) WHERE key = ?",
+                    [(accessed, key) for key, accessed in self._accessed.items()]
+                )
+                self._connection.execute("COMMIT")
+            except Exception:
+                self._connection.execute("ROLLBACK")
+                raise
+            self._accessed.clear()
+
+    def clear(self):
+        """
+        Removes all results from memory and disk.
+
+        Other processes may still serve results from their memory tier for up to memory_max_age seconds.
+        """
+        self._memory.clear()
+        self._accessed.clear()
+        self._connection.execute("DELETE FROM results")
+
+    def stats(self):
+        """
+        Returns the hit and miss counters of this cache instance.
+
+        Returns:
+            dict: Memory hits, disk hits, misses, hit rate and number of results in memory.
+        """
+        lookups = self.memory_hits + self.disk_hits + self.misses
+        return {
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "hit_rate": (self.memory_hits + self.disk_hits) / lookups if lookups else 0.0,
+            "memory_entries": len(self._memory)
+        }
+
+    def close(self):
+        """
+        Writes pending access times and closes the database connection.
+        """
+        self._flush_accessed()
+        self._connection.close()
+
+
 def introduce_user():
     """
     Briefly introduces the user to the `cube.py` file.
@@ -0,0 +1,203 @@
+import multiprocessing
+import os
+import struct
+import subprocess
+import sys
+import tempfile
+import time
+import unittest
+
+from cube import Cube, SharedCubeStore, SolveResultCache
+
+
+class TestMoves(unittest.TestCase):
+    def test_move_followed_by_inverse_restores_solved_state(self):
+        for move, inverse_move in Cube.INVERSE_MOVES.items():
+            with self.subTest(move=move):
+                cube = Cube()
+                cube.move([move, inverse_move])
+                self.assertEqual(cube.snapshot(), Cube.SOLVED_STATE)
+
+    def test_moves_are_permutations(self):
+        for move in Cube.MOVE_METHODS:
+            with self.subTest(move=move):
+                cube = Cube()
+                cube.move([move])
+                self.assertEqual(sorted(map(str, cube.snapshot())), sorted(map(str, Cube.SOLVED_STATE)))
+                self.assertNotEqual(cube.snapshot(), Cube.SOLVED_STATE)
+
+    def test_four_quarter_turns_restore_solved_state(self):
+        for move in Cube.MOVE_METHODS:
+            with self.subTest(move=move):
+                cube = Cube()
+                cube.move([move] * 4)
+                self.assertEqual(cube.snapshot(), Cube.SOLVED_STATE)
+
+
+class TestHistory(unittest.TestCase):
+    def test_undo_and_redo_moves(self):
+        cube = Cube()
+        cube.move(["R", "U", "F'", "L", "B", "D'"])
+        scrambled = cube.snapshot()
+
+        self.assertEqual(cube.undo(6), 6)
+        self.assertEqual(cube.snapshot(), Cube.SOLVED_STATE)
+        self.assertEqual(cube.redo(6), 6)
+        self.assertEqual(cube.snapshot(), scrambled)
+
+    def test_failed_undo_keeps_history(self):
+        cube = Cube()
+        cube.move(["U"])
+        cube.move_u_counter_clockwise = None
+
+        with self.assertRaises(TypeError):
+            cube.undo()
+
+        del cube.move_u_counter_clockwise
+        self.assertEqual(cube.undo(), 1)
+        self.assertEqual(cube.snapshot(), Cube.SOLVED_STATE)
+
+    def test_set_state_clears_history(self):
+        cube = Cube()
+        cube.move(["U", "R"])
+        state = Cube().get_cube_state()
+        cube.set_state(state["corners"], state["edges"])
+
+        self.assertEqual(cube.undo(), 0)
+        self.assertEqual(cube.snapshot(), Cube.SOLVED_STATE)
+
+    def test_restore_clears_history(self):
+        cube = Cube()
+        cube.move(["U", "R"])
+        scrambled = cube.snapshot()
+        cube.restore(Cube.SOLVED_STATE)
+
+        self.assertEqual(cube.undo(), 0)
+        self.assertEqual(cube.snapshot(), Cube.SOLVED_STATE)
+
+        cube.restore(scrambled)
+        self.assertEqual(cube.redo(), 0)
+        self.assertEqual(cube.snapshot(), scrambled)
+
+
+class TestSharedCubeStore(unittest.TestCase):
+    def setUp(self):
+        self.store = SharedCubeStore(capacity=4, create=True)
+        self.addCleanup(self.store.unlink)
+        self.addCleanup(self.store.close)
+        self.store.put("robot", Cube())
+
+    def test_store_survives_reader_process_exit(self):
+        reader = f"from cube import SharedCubeStore\nstore = SharedCubeStore({self.store.name!r})\nstore.get('robot')\nstore.close()"
+        for _ in range(2):
+            subprocess.run([sys.executable, "-c", reader], check=True, capture_output=True, cwd=os.path.dirname(__file__) or None)
+
+        self.assertEqual(self.store.get("robot").snapshot(), Cube.SOLVED_STATE)
+
+    @unittest.skipUnless("fork" in multiprocessing.get_all_start_methods(), "requires the fork start method")
+    def test_forked_readers_keep_writer_registration(self):
+        writer = (
+            "import multiprocessing\n"
+            "from cube import Cube, SharedCubeStore\n"
+            "def read(name):\n"
+            "    store = SharedCubeStore(name)\n"
+            "    store.get('robot')\n"
+            "    store.close()\n"
+            "if __name__ == '__main__':\n"
+            "    store = SharedCubeStore(capacity=1, create=True)\n"
+            "    store.put('robot', Cube())\n"
+            "    readers = [multiprocessing.get_context('fork').Process(target=read, args=(store.name,)) for _ in range(3)]\n"
+            "    for reader in readers:\n"
+            "        reader.start()\n"
+            "    for reader in readers:\n"
+            "        reader.join()\n"
+            "    store.get('robot')\n"
+            "    store.close()\n"
+            "    store.unlink()\n"
+        )
+        result = subprocess.run([sys.executable, "-c", writer], check=True, capture_output=True, text=True,
+                                cwd=os.path.dirname(__file__) or None)
+
+        self.assertNotIn("Error", result.stderr)
+        self.assertNotIn("leaked", result.stderr)
+
+    def test_sequence_counter_wraps(self):
+        offset = self.store._slot_offset("robot")
+        struct.pack_into("<I", self.store.shared_memory.buf, offset, 0xFFFFFFFE)
+        cube = Cube()
+        cube.move(["U"])
+        self.store.put("robot", cube)
+
+        self.assertEqual(self.store.version("robot"), 0)
+        self.assertEqual(self.store.get("robot").snapshot(), cube.snapshot())
+
+    def test_interrupted_write_times_out(self):
+        offset = self.store._slot_offset("robot")
+        struct.pack_into("<I", self.store.shared_memory.buf, offset, 1)
+
+        with self.assertRaises(TimeoutError):
+            self.store.get_bytes("robot", timeout=0.01)
+
+    def test_rejected_put_leaves_slot_readable(self):
+        for edge in ("ll", "ä"):
+            with self.subTest(edge=edge):
+                cube = Cube()
+                cube.edge_front_bottom = edge
+
+                with self.assertRaises(ValueError):
+                    self.store.put("robot", cube)
+                with self.assertRaises(ValueError):
+                    self.store.put("other", cube)
+
+                self.assertEqual(self.store.version("robot"), 0)
+                self.assertEqual(self.store.get("robot").snapshot(), Cube.SOLVED_STATE)
+                self.assertEqual(self.store.names(), ["robot"])
+
+
+class TestSolveResultCache(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.file_path = os.path.join(directory.name, "Solve_Cache.sqlite")
+        self.cube = Cube()
+        self.cube.move(["R", "U"])
+
+    def open_cache(self, **kwargs):
+        cache = SolveResultCache(self.file_path, **kwargs)
+        self.addCleanup(cache.close)
+        return cache
+
+    def test_memory_and_disk_return_equal_copies(self):
+        cache = self.open_cache()
+        cache.put(self.cube, ("U'", "R'"))
+
+        result = cache.get(self.cube)
+        result.append("F")
+
+        self.assertEqual(cache.get(self.cube), ["U'", "R'"])
+        self.assertEqual(self.open_cache().get(self.cube.to_bytes()), ["U'", "R'"])
+
+    def test_memory_hits_update_disk_access_time(self):
+        cache = self.open_cache()
+        cache.put(self.cube, ["U'", "R'"])
+        query = "SELECT accessed FROM results"
+        accessed = cache._connection.execute(query).fetchone()[0]
+
+        time.sleep(0.01)
+        cache.get(self.cube)
+        cache.evict()
+
+        self.assertGreater(cache._connection.execute(query).fetchone()[0], accessed)
+
+    def test_memory_tier_revalidates_after_memory_max_age(self):
+        cache = self.open_cache(memory_max_age=0.05)
+        cache.put(self.cube, ["U'", "R'"])
+        self.open_cache().clear()
+
+        time.sleep(0.1)
+
+        self.assertIsNone(cache.get(self.cube))
+
+
+if __name__ == "__main__":
+    unittest.main()